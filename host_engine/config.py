@@ -2,17 +2,21 @@
 MAI Framework V2 - Intelligence Engine Configuration
 """
 
-import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# Resolved once at import; passing None when the file is absent lets
+# pydantic-settings skip the dotenv parse attempt entirely.
+_ENV_FILE = Path(__file__).parent.parent / ".env.host"
+
+
 class EngineConfig(BaseSettings):
     """Configuration for the MLX Intelligence Engine."""
 
     model_config = SettingsConfigDict(
-        env_file=str(Path(__file__).parent.parent / ".env.host"),
+        env_file=str(_ENV_FILE) if _ENV_FILE.exists() else None,
         env_prefix="MLX_",
         case_sensitive=False,
         extra="ignore"  # Ignore extra env vars that don't match fields
@@ -45,12 +49,7 @@ class EngineConfig(BaseSettings):
         return self.model_dir if self.model_dir else self.model_directory
 
 
-_config: Optional[EngineConfig] = None
-
-
+@lru_cache(maxsize=1)
 def get_config() -> EngineConfig:
     """Get cached configuration."""
-    global _config
-    if _config is None:
-        _config = EngineConfig()
-    return _config
+    return EngineConfig()
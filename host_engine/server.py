@@ -12,15 +12,12 @@ import json
 import time
 import signal
 import asyncio
-import subprocess
-from pathlib import Path
 from typing import Optional, Dict, Any, List
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
-import uvicorn
 import httpx
 
 from config import EngineConfig, get_config
@@ -30,21 +27,6 @@ from config import EngineConfig, get_config
 # Models
 # ============================================
 
-class ChatMessage(BaseModel):
-    role: str
-    content: str
-
-
-class ChatCompletionRequest(BaseModel):
-    model: Optional[str] = None
-    messages: List[ChatMessage]
-    max_tokens: int = Field(default=2048)
-    temperature: float = Field(default=0.7)
-    top_p: float = Field(default=1.0)
-    stream: bool = Field(default=False)
-    stop: Optional[List[str]] = None
-
-
 class LoadModelRequest(BaseModel):
     model: str
     max_tokens: Optional[int] = None
@@ -71,64 +53,115 @@ class MLXEngineManager:
 
     def __init__(self, config: EngineConfig):
         self.config = config
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
         self.current_model: Optional[str] = None
         self.start_time: Optional[float] = None
-        self._health_check_client = httpx.AsyncClient(timeout=5.0)
+        self._health_client: Optional[httpx.AsyncClient] = None
+        self._proxy_client = httpx.AsyncClient(
+            timeout=120.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
         self._restart_attempts = 0
         self._max_restart_attempts = 3
         self._monitoring = False
+        self._status_cache: Optional[tuple] = None  # (monotonic, ServerStatus)
+        # Precomputed once: mlx_url is read on every proxied request and
+        # health probe, and the command only varies by model
+        self._mlx_url = f"http://127.0.0.1:{config.internal_port}"
+        self._cmd_base = [
+            sys.executable, "-m", "mlx_lm.server",
+            "--host", "127.0.0.1",  # Internal only, we proxy it
+            "--port", str(config.internal_port),
+            "--max-tokens", str(config.max_tokens),
+            "--log-level", "INFO"
+        ]
 
     @property
     def mlx_url(self) -> str:
-        return f"http://127.0.0.1:{self.config.internal_port}"
+        return self._mlx_url
+
+    @property
+    def _health_check_client(self) -> httpx.AsyncClient:
+        """Health-check client, constructed lazily on first probe."""
+        if self._health_client is None:
+            self._health_client = httpx.AsyncClient(timeout=5.0)
+        return self._health_client
 
     async def start(self, model: Optional[str] = None) -> bool:
         """Start the MLX-LM server process."""
-        if self.process and self.process.poll() is None:
+        if self.process and self.process.returncode is None:
             return True  # Already running
 
         model = model or self.config.active_model
 
-        cmd = [
-            sys.executable, "-m", "mlx_lm.server",
-            "--model", model,
-            "--host", "127.0.0.1",  # Internal only, we proxy it
-            "--port", str(self.config.internal_port),
-            "--max-tokens", str(self.config.max_tokens),
-            "--log-level", "INFO"
-        ]
+        cmd = self._cmd_base + ["--model", model]
 
         print(f"[Engine] Starting MLX server with model: {model}")
 
-        self.process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            preexec_fn=os.setsid  # Create new process group for clean shutdown
+        # asyncio subprocess so the fork/exec doesn't stall the event loop
+        # (the parent can be multi-GB once MLX has loaded weights)
+        self.process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=True  # New process group for clean shutdown
         )
+        asyncio.create_task(self._drain_output(self.process.stdout))
 
         self.current_model = model
         self.start_time = time.time()
-
-        # Wait for server to be ready
-        for _ in range(30):
+        self._status_cache = None
+
+        # Wait for the server socket to come up (cheap TCP probe). Poll
+        # fast at first so quick swaps feel interactive, then back off so
+        # a slow model load doesn't get hammered with probes.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 60
+        delay = 0.05
+        while True:
             # Check if process died during startup
-            if self.process.poll() is not None:
+            if self.process.returncode is not None:
                 print(f"[Engine] Process died during startup (exit code: {self.process.returncode})")
                 self.process = None
                 return await self._handle_crash()
 
+            if await self._is_listening():
+                break
+
+            if loop.time() >= deadline:
+                print("[Engine] MLX server failed to start")
+                return False
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
+
+        # Final readiness gate: HTTP probe once the socket accepts
+        deadline = loop.time() + 5
+        delay = 0.05
+        while loop.time() < deadline:
             if await self._is_healthy():
                 print(f"[Engine] MLX server ready on port {self.config.internal_port}")
                 self._restart_attempts = 0  # Reset on successful start
                 return True
-            await asyncio.sleep(1)
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
 
         print("[Engine] MLX server failed to start")
         return False
 
+    async def _drain_output(self, stream: asyncio.StreamReader):
+        """Continuously drain the MLX server's combined stdout/stderr.
+
+        Without a reader the OS pipe buffer (~64 KB) fills up and blocks
+        the child on its next write, which looks like a hang and can
+        trigger spurious crash-recovery restarts.
+        """
+        while True:
+            line = await stream.readline()
+            if not line:
+                break
+            print(f"[MLX] {line.decode(errors='replace').rstrip()}")
+
     async def _handle_crash(self) -> bool:
         """Handle process crash with exponential backoff retry."""
         self._restart_attempts += 1
@@ -162,22 +195,29 @@ class MLXEngineManager:
             pass
 
         try:
-            self.process.wait(timeout=10)
-        except subprocess.TimeoutExpired:
+            await asyncio.wait_for(self.process.wait(), timeout=10)
+        except asyncio.TimeoutError:
             # Force kill if graceful shutdown fails
             try:
                 os.killpg(os.getpgid(self.process.pid), signal.SIGKILL)
             except ProcessLookupError:
                 pass
-            self.process.wait()
+            await self.process.wait()
 
         self.process = None
         self.current_model = None
         self.start_time = None
+        self._status_cache = None
 
         print("[Engine] MLX server stopped")
         return True
 
+    async def aclose(self):
+        """Close the long-lived HTTP clients (called on lifespan shutdown)."""
+        await self._proxy_client.aclose()
+        if self._health_client is not None:
+            await self._health_client.aclose()
+
     async def swap_model(self, new_model: str) -> bool:
         """Hot-swap to a different model."""
         print(f"[Engine] Hot-swapping model: {self.current_model} -> {new_model}")
@@ -186,6 +226,23 @@ class MLXEngineManager:
         await asyncio.sleep(2)  # Allow memory to be freed
         return await self.start(new_model)
 
+    async def _is_listening(self) -> bool:
+        """Check if the MLX server socket accepts connections.
+
+        Much cheaper than an HTTP probe — used while polling during
+        startup so we don't hit /v1/models once a second.
+        """
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection("127.0.0.1", self.config.internal_port),
+                timeout=0.5
+            )
+            writer.close()
+            await writer.wait_closed()
+            return True
+        except (OSError, asyncio.TimeoutError):
+            return False
+
     async def _is_healthy(self) -> bool:
         """Check if MLX server is responding."""
         try:
@@ -208,7 +265,7 @@ class MLXEngineManager:
             if not self._monitoring:
                 break
 
-            if self.process and self.process.poll() is not None:
+            if self.process and self.process.returncode is not None:
                 print(f"[Engine] Process died unexpectedly (exit code: {self.process.returncode})")
                 self.process = None
                 await self._handle_crash()
@@ -221,27 +278,48 @@ class MLXEngineManager:
         self,
         method: str,
         path: str,
-        body: Optional[Dict] = None,
+        content: Optional[bytes] = None,
         stream: bool = False
     ):
-        """Proxy request to underlying MLX server."""
-        url = f"{self.mlx_url}{path}"
+        """Proxy request to underlying MLX server.
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            if stream:
-                async with client.stream(method, url, json=body) as response:
-                    async for chunk in response.aiter_bytes():
-                        yield chunk
-            else:
-                response = await client.request(method, url, json=body)
-                yield response.content
+        The body is forwarded as pre-serialized JSON bytes to avoid an
+        extra dict -> JSON encode inside httpx.
+        """
+        url = f"{self.mlx_url}{path}"
+        headers = {"content-type": "application/json"} if content is not None else None
+
+        if stream:
+            # identity encoding: no point gzip-decoding loopback traffic,
+            # and aiter_raw can then forward bytes without re-chunking
+            stream_headers = dict(headers or {})
+            stream_headers["accept-encoding"] = "identity"
+            async with self._proxy_client.stream(
+                method, url, content=content, headers=stream_headers
+            ) as response:
+                async for chunk in response.aiter_raw(chunk_size=16384):
+                    yield chunk
+        else:
+            response = await self._proxy_client.request(
+                method, url, content=content, headers=headers
+            )
+            yield response.content
 
     def get_status(self) -> ServerStatus:
-        """Get current server status."""
-        running = self.process is not None and self.process.poll() is None
+        """Get current server status (cached for 500 ms).
+
+        /status and /health both land here and are polled by healthchecks;
+        the short cache keeps aggressive probing from re-checking the
+        process on every call. start()/stop() invalidate it.
+        """
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < 0.5:
+            return self._status_cache[1]
+
+        running = self.process is not None and self.process.returncode is None
         uptime = time.time() - self.start_time if self.start_time else 0
 
-        return ServerStatus(
+        status = ServerStatus(
             status="running" if running else "stopped",
             mlx_server_running=running,
             current_model=self.current_model,
@@ -249,6 +327,8 @@ class MLXEngineManager:
             port=self.config.port,
             restart_attempts=self._restart_attempts
         )
+        self._status_cache = (now, status)
+        return status
 
 
 # ============================================
@@ -282,13 +362,15 @@ async def lifespan(app: FastAPI):
     print("[Engine] Shutting down...")
     engine.stop_monitoring()
     await engine.stop()
+    await engine.aclose()
 
 
 app = FastAPI(
     title="MAI Intelligence Engine",
     description="MLX-LM Server with Hot-Swap Support",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
@@ -332,21 +414,35 @@ async def start_server(model: Optional[str] = None):
     return {"status": "started", "model": engine.current_model}
 
 
+# Cached directory scan, keyed on the directory's mtime. The model
+# directory rarely changes but this endpoint may be polled by dashboards.
+_models_cache: Optional[tuple] = None  # (mtime_ns, models)
+
+
 @app.get("/models/available")
 async def list_available_models():
     """List available models in the model directory."""
-    model_dir = Path(config.active_model_directory)
-    if not model_dir.exists():
+    global _models_cache
+
+    model_dir = config.active_model_directory
+    try:
+        mtime_ns = os.stat(model_dir).st_mtime_ns
+    except OSError:
         return {"models": []}
 
-    models = []
-    for path in model_dir.iterdir():
-        if path.is_dir() and (path / "config.json").exists():
-            models.append({
-                "id": path.name,
-                "path": str(path)
-            })
+    if _models_cache is not None and _models_cache[0] == mtime_ns:
+        return {"models": _models_cache[1]}
 
+    models = []
+    with os.scandir(model_dir) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False) and os.path.exists(os.path.join(entry.path, "config.json")):
+                models.append({
+                    "id": entry.name,
+                    "path": entry.path
+                })
+
+    _models_cache = (mtime_ns, models)
     return {"models": models}
 
 
@@ -358,15 +454,25 @@ async def list_available_models():
 async def list_models():
     """List currently loaded models (OpenAI compatible)."""
     async for response in engine.proxy_request("GET", "/v1/models"):
-        return JSONResponse(content=json.loads(response))
+        return Response(content=response, media_type="application/json")
 
 
 @app.post("/v1/chat/completions")
-async def chat_completions(request: ChatCompletionRequest):
-    """Chat completions endpoint (OpenAI compatible)."""
-    body = request.model_dump()
+async def chat_completions(request: Request):
+    """Chat completions endpoint (OpenAI compatible).
+
+    The body is forwarded verbatim; the underlying mlx_lm.server does the
+    authoritative schema validation, so re-validating here would only add
+    per-request overhead.
+    """
+    body = await request.body()
 
-    if request.stream:
+    try:
+        stream = bool(json.loads(body).get("stream", False))
+    except (json.JSONDecodeError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+
+    if stream:
         async def stream_generator():
             async for chunk in engine.proxy_request(
                 "POST", "/v1/chat/completions", body, stream=True
@@ -381,7 +487,7 @@ async def chat_completions(request: ChatCompletionRequest):
         async for response in engine.proxy_request(
             "POST", "/v1/chat/completions", body
         ):
-            return JSONResponse(content=json.loads(response))
+            return Response(content=response, media_type="application/json")
 
 
 @app.get("/health")
@@ -408,9 +514,19 @@ async def readiness_check():
 # ============================================
 
 if __name__ == "__main__":
+    # Imported here so restarted/forked children don't pay for it
+    import uvicorn
+
+    # Single worker by design: the manager owns the mlx_lm subprocess and
+    # the /load, /stop and /status state; extra workers would each spawn
+    # their own engine and fight over the internal port. Throughput is
+    # bounded by the single MLX backend, not this proxy.
     uvicorn.run(
         app,
         host=config.host,
         port=config.port,
-        log_level="info"
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+        access_log=False  # One log record per proxied chunk otherwise
     )
@@ -1,6 +1,6 @@
 """Chat completion endpoints."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from src.api.schemas import ChatCompletionRequest, ChatCompletionResponse
 from src.core.utils.logging import get_logger_with_context
@@ -43,12 +43,19 @@ async def chat_completions(request: ChatCompletionRequest):
     mlx_client = get_mlx_client()
 
     try:
-        response = await mlx_client.chat_completion(
+        upstream = await mlx_client.chat_completion_raw(
             messages=[msg.model_dump() for msg in request.messages],
             max_tokens=request.max_tokens,
             temperature=request.temperature
         )
-        return response
+        # Proxy the upstream bytes through as-is; parsing them here just
+        # to have FastAPI re-serialize the same JSON wastes CPU on large
+        # completions
+        return Response(
+            content=upstream.content,
+            media_type="application/json",
+            status_code=upstream.status_code
+        )
     except Exception as e:
         logger.error(f"Chat completion failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -12,7 +12,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class MlxLmSettings(BaseSettings):
     """MLX-LM server configuration for hybrid architecture."""
 
-    model_config = SettingsConfigDict(env_prefix="MLXLM__")
+    model_config = SettingsConfigDict(env_prefix="MLXLM__", frozen=True)
 
     # CRITICAL: When running in Docker, this MUST point to host.docker.internal
     base_url: str = Field(
@@ -29,7 +29,23 @@ class MlxLmSettings(BaseSettings):
     )
     max_tokens: int = Field(default=32768, ge=1)
     temperature: float = Field(default=0.7, ge=0.0, le=2.0)
-    timeout: int = Field(default=120, ge=1)
+    timeout: int = Field(
+        default=120, ge=1,
+        description="Read timeout in seconds (covers long generations)"
+    )
+    connect_timeout: float = Field(
+        default=5.0, ge=0.1,
+        description="Connect timeout; keep low to fail fast on a dead server"
+    )
+    write_timeout: float = Field(default=10.0, ge=0.1)
+    pool_timeout: float = Field(
+        default=1.0, ge=0.1,
+        description="Max wait for a pooled connection"
+    )
+    keepalive_expiry: float = Field(
+        default=300.0, ge=1.0,
+        description="Idle keep-alive lifetime; generous for the local MLX link"
+    )
 
     @field_validator("base_url")
     @classmethod
@@ -44,7 +60,7 @@ class MlxLmSettings(BaseSettings):
 class DatabaseSettings(BaseSettings):
     """Database configuration using Docker service names."""
 
-    model_config = SettingsConfigDict(env_prefix="DATABASE__")
+    model_config = SettingsConfigDict(env_prefix="DATABASE__", frozen=True)
 
     # Docker service name 'postgres' resolves within the network
     url: str = Field(
@@ -60,7 +76,7 @@ class DatabaseSettings(BaseSettings):
 class RedisSettings(BaseSettings):
     """Redis configuration using Docker service names."""
 
-    model_config = SettingsConfigDict(env_prefix="REDIS__")
+    model_config = SettingsConfigDict(env_prefix="REDIS__", frozen=True)
 
     # Docker service name 'redis' resolves within the network
     url: str = Field(
@@ -74,7 +90,7 @@ class RedisSettings(BaseSettings):
 class QdrantSettings(BaseSettings):
     """Qdrant configuration using Docker service names."""
 
-    model_config = SettingsConfigDict(env_prefix="QDRANT__")
+    model_config = SettingsConfigDict(env_prefix="QDRANT__", frozen=True)
 
     # Docker service name 'qdrant' resolves within the network
     url: str = Field(
@@ -94,7 +110,8 @@ class Settings(BaseSettings):
         env_file=".env.docker",
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        frozen=True
     )
 
     # Application
@@ -6,19 +6,25 @@ import logging
 import sys
 from typing import Optional
 
+# Configure the shared "mai" root logger exactly once at import time.
+# Child loggers propagate to it, so get_logger_with_context is a plain
+# lookup with no per-call handler checks or level mutation (which used
+# to run on every call, including reload cycles).
+_root_logger = logging.getLogger("mai")
+if not _root_logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
+    )
+    _root_logger.addHandler(_handler)
+    _root_logger.setLevel(logging.INFO)
+
 
 def get_logger_with_context(module: str, level: Optional[str] = None) -> logging.Logger:
     """Get a logger with context."""
     logger = logging.getLogger(f"mai.{module}")
-
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-        )
-        logger.addHandler(handler)
-
-    logger.setLevel(level or logging.INFO)
+    if level is not None:
+        logger.setLevel(level)
     return logger
@@ -3,6 +3,10 @@ MAI Framework V2 - MLX-LM HTTP Client
 Communicates with bare-metal MLX server via OpenAI-compatible API
 """
 
+import asyncio
+import time
+from functools import lru_cache
+
 import httpx
 from typing import AsyncGenerator, Optional, Dict, Any, List
 from pydantic import BaseModel
@@ -11,8 +15,23 @@ import json
 from src.core.utils.config import get_settings
 from src.core.utils.logging import get_logger_with_context
 
+# orjson is ~2-3x faster on the small dicts SSE chunks decode into;
+# fall back to stdlib json if it isn't installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
 logger = get_logger_with_context(module="mlxlm_client")
 
+# SSE framing constants, hoisted so the per-chunk stream loop compares
+# against preallocated bytes objects
+_SSE_DATA_PREFIX = b"data: "
+_SSE_DATA_PREFIX_LEN = len(_SSE_DATA_PREFIX)
+_SSE_DONE = b"[DONE]"
+_SSE_EVENT_DELIMITER = b"\n\n"
+
 
 class ChatMessage(BaseModel):
     """Chat message model."""
@@ -39,64 +58,142 @@ class MLXLMClient:
     via host.docker.internal when running inside Docker.
     """
 
+    HEALTH_FRESH_TTL = 2.0   # Seconds a health result is served as-is
+    HEALTH_STALE_TTL = 30.0  # Seconds a stale result may bridge a refresh
+
+    # Endpoint paths, resolved against the client's base_url so no URL
+    # string is formatted per request
+    MODELS_PATH = "/models"
+    CHAT_PATH = "/chat/completions"
+
     def __init__(self):
         self.settings = get_settings().mlxlm
         self.base_url = self.settings.base_url.rstrip("/")
+        # Bind hot-path defaults to plain attributes so payload building
+        # doesn't walk Pydantic attribute access per request
+        self._model_name = self.settings.model_name
+        self._max_tokens = self.settings.max_tokens
+        self._temperature = self.settings.temperature
+        # Template for chat payloads; per-call overrides are applied to a
+        # shallow copy so the common case skips most key assignments
+        self._payload_defaults = {
+            "model": self._model_name,
+            "max_tokens": self._max_tokens,
+            "temperature": self._temperature,
+            "stream": False
+        }
         self.timeout = httpx.Timeout(
-            connect=10.0,
+            connect=self.settings.connect_timeout,
             read=self.settings.timeout,
-            write=10.0,
-            pool=5.0
+            write=self.settings.write_timeout,
+            pool=self.settings.pool_timeout
         )
-
-    def _get_headers(self) -> Dict[str, str]:
-        """Get request headers."""
-        return {
+        # Fixed for the client's lifetime, so build once and attach to
+        # the pooled client rather than rebuilding per request
+        self._headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.settings.api_key}"
         }
+        self._client: Optional[httpx.AsyncClient] = None
+        # Health result cache: fresh for HEALTH_FRESH_TTL, served stale up
+        # to HEALTH_STALE_TTL while a background refresh runs
+        self._health_cache: Optional[tuple] = None  # (monotonic, result)
+        self._health_lock = asyncio.Lock()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it lazily on first use.
+
+        A single pooled client keeps connections alive across calls, so
+        health polls and chat requests skip the per-request TCP setup.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                headers=self._headers,
+                limits=httpx.Limits(
+                    max_keepalive_connections=100,
+                    max_connections=1000,
+                    # httpx's 5 s default closes idle sockets between
+                    # health polls; the local MLX link has no NAT timeout
+                    # so keep connections warm much longer
+                    keepalive_expiry=self.settings.keepalive_expiry
+                )
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client (called on application shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def health_check(self) -> Dict[str, Any]:
         """
         Check if MLX server is healthy.
 
+        Results are cached with stale-while-revalidate semantics so that
+        polling endpoints (/health/detailed, llm-status) don't translate
+        into one MLX round-trip per call: fresh results are returned
+        directly, stale-but-recent ones are served while a background
+        task refreshes the cache.
+
         Returns:
             Health status including model info
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/models",
-                    headers=self._get_headers()
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                models = data.get("data", [])
-
-                return {
-                    "status": "healthy",
-                    "connected": True,
-                    "models": [m.get("id") for m in models],
-                    "current_model": models[0].get("id") if models else None
-                }
-            except httpx.HTTPError as e:
-                logger.error(f"MLX health check failed: {e}")
-                return {
-                    "status": "unhealthy",
-                    "connected": False,
-                    "error": str(e)
-                }
+        if self._health_cache is not None:
+            age = time.monotonic() - self._health_cache[0]
+            if age < self.HEALTH_FRESH_TTL:
+                return self._health_cache[1]
+            if age < self.HEALTH_STALE_TTL:
+                if not self._health_lock.locked():
+                    asyncio.create_task(self._refresh_health())
+                return self._health_cache[1]
+
+        return await self._refresh_health()
+
+    async def _refresh_health(self) -> Dict[str, Any]:
+        """Fetch health from the MLX server and update the cache."""
+        async with self._health_lock:
+            # Another task may have refreshed while we waited on the lock
+            if self._health_cache is not None:
+                if time.monotonic() - self._health_cache[0] < self.HEALTH_FRESH_TTL:
+                    return self._health_cache[1]
+
+            result = await self._fetch_health()
+            self._health_cache = (time.monotonic(), result)
+            return result
+
+    async def _fetch_health(self) -> Dict[str, Any]:
+        """Perform the actual health probe against the MLX server."""
+        client = self._get_client()
+        try:
+            response = await client.get(self.MODELS_PATH)
+            response.raise_for_status()
+
+            data = response.json()
+            models = data.get("data", [])
+
+            return {
+                "status": "healthy",
+                "connected": True,
+                "models": [m.get("id") for m in models],
+                "current_model": models[0].get("id") if models else None
+            }
+        except httpx.HTTPError as e:
+            logger.error(f"MLX health check failed: {e}")
+            return {
+                "status": "unhealthy",
+                "connected": False,
+                "error": str(e)
+            }
 
     async def list_models(self) -> List[Dict[str, Any]]:
         """List available models."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.base_url}/models",
-                headers=self._get_headers()
-            )
-            response.raise_for_status()
-            return response.json().get("data", [])
+        client = self._get_client()
+        response = await client.get(self.MODELS_PATH)
+        response.raise_for_status()
+        return response.json().get("data", [])
 
     async def chat_completion(
         self,
@@ -118,23 +215,46 @@ class MLXLMClient:
         Returns:
             OpenAI-compatible completion response
         """
-        payload = {
-            "model": model or self.settings.model_name,
-            "messages": messages,
-            "max_tokens": max_tokens or self.settings.max_tokens,
-            "temperature": temperature or self.settings.temperature,
-            "stream": False,
+        response = await self.chat_completion_raw(
+            messages,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
             **kwargs
-        }
+        )
+        # Completion payloads can be large; orjson parses them much
+        # faster than httpx's stdlib-json .json()
+        return _json_loads(response.content)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers=self._get_headers(),
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+    async def chat_completion_raw(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Create a chat completion and return the raw upstream response.
+
+        Lets proxy-style callers pass the response bytes straight through
+        to the client without a decode/re-encode round-trip; use
+        chat_completion when the parsed dict is needed.
+        """
+        payload = {**self._payload_defaults, "messages": messages}
+        if model:
+            payload["model"] = model
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+        if temperature:
+            payload["temperature"] = temperature
+        if kwargs:
+            payload.update(kwargs)
+
+        client = self._get_client()
+        response = await client.post(self.CHAT_PATH, json=payload)
+        response.raise_for_status()
+        return response
 
     async def chat_completion_stream(
         self,
@@ -156,43 +276,49 @@ class MLXLMClient:
         Yields:
             Stream chunks in OpenAI format
         """
-        payload = {
-            "model": model or self.settings.model_name,
-            "messages": messages,
-            "max_tokens": max_tokens or self.settings.max_tokens,
-            "temperature": temperature or self.settings.temperature,
-            "stream": True,
-            **kwargs
-        }
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            async with client.stream(
-                "POST",
-                f"{self.base_url}/chat/completions",
-                headers=self._get_headers(),
-                json=payload
-            ) as response:
-                response.raise_for_status()
-
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data = line[6:]  # Remove "data: " prefix
-                        if data == "[DONE]":
-                            break
-                        try:
-                            chunk = json.loads(data)
-                            yield chunk
-                        except json.JSONDecodeError:
-                            continue
+        payload = {**self._payload_defaults, "messages": messages, "stream": True}
+        if model:
+            payload["model"] = model
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+        if temperature:
+            payload["temperature"] = temperature
+        if kwargs:
+            payload.update(kwargs)
 
+        client = self._get_client()
+        async with client.stream(
+            "POST",
+            self.CHAT_PATH,
+            json=payload
+        ) as response:
+            response.raise_for_status()
 
-# Singleton instance
-_mlx_client: Optional[MLXLMClient] = None
+            # Manual SSE framing over raw bytes: events are delimited by
+            # b"\n\n" and payloads follow b"data: ". Skips aiter_lines'
+            # per-read UTF-8 decode and universal-newline splitting.
+            buf = bytearray()
+            done = False
+            async for raw in response.aiter_bytes(chunk_size=65536):
+                buf += raw
+                while not done and (end := buf.find(_SSE_EVENT_DELIMITER)) != -1:
+                    event = bytes(buf[:end])
+                    del buf[:end + 2]
+                    for line in event.split(b"\n"):
+                        if line.startswith(_SSE_DATA_PREFIX):
+                            data = line[_SSE_DATA_PREFIX_LEN:]
+                            if data == _SSE_DONE:
+                                done = True
+                                break
+                            try:
+                                yield _json_loads(data)
+                            except ValueError:
+                                continue
+                if done:
+                    break
 
 
+@lru_cache(maxsize=1)
 def get_mlx_client() -> MLXLMClient:
     """Get or create MLX client singleton."""
-    global _mlx_client
-    if _mlx_client is None:
-        _mlx_client = MLXLMClient()
-    return _mlx_client
+    return MLXLMClient()
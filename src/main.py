@@ -2,14 +2,15 @@
 MAI Framework V2 - FastAPI Application
 """
 
+import asyncio
 from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.core.utils.config import get_settings
 from src.core.utils.logging import get_logger_with_context
-from src.infrastructure.llm.mlxlm_client import get_mlx_client
-from src.api.routes import health, chat
 
 logger = get_logger_with_context(module="main")
 settings = get_settings()
@@ -26,14 +27,38 @@ async def lifespan(app: FastAPI):
     logger.info(f"Redis: {settings.redis.url}")
     logger.info(f"MLX Server: {settings.mlxlm.base_url}")
 
-    # Check MLX server connection
+    # Check MLX server connection (imported here to keep module import light)
+    from src.infrastructure.llm.mlxlm_client import get_mlx_client
+
     mlx_client = get_mlx_client()
-    mlx_health = await mlx_client.health_check()
-    if mlx_health["connected"]:
-        logger.info(f"MLX server connected. Model: {mlx_health.get('current_model')}")
-    else:
-        logger.warning(f"MLX server not available: {mlx_health.get('error')}")
-        logger.warning("Chat functionality will be degraded until MLX server is available")
+
+    # Probe in the background so a slow/dead MLX server can't block app
+    # startup (and with it Docker healthchecks) for the full timeout
+    async def check_mlx_connection():
+        # Warm the OS resolver cache for host.docker.internal so the
+        # first real request doesn't pay the DNS lookup
+        parts = urlsplit(settings.mlxlm.base_url)
+        if parts.hostname:
+            try:
+                await asyncio.get_running_loop().getaddrinfo(
+                    parts.hostname, parts.port or 80
+                )
+            except OSError as e:
+                logger.warning(f"Could not resolve MLX host {parts.hostname}: {e}")
+
+        try:
+            mlx_health = await asyncio.wait_for(mlx_client.health_check(), timeout=2.0)
+        except asyncio.TimeoutError:
+            logger.warning("MLX server health check timed out")
+            logger.warning("Chat functionality will be degraded until MLX server is available")
+            return
+        if mlx_health["connected"]:
+            logger.info(f"MLX server connected. Model: {mlx_health.get('current_model')}")
+        else:
+            logger.warning(f"MLX server not available: {mlx_health.get('error')}")
+            logger.warning("Chat functionality will be degraded until MLX server is available")
+
+    asyncio.create_task(check_mlx_connection())
 
     logger.info("MAI Framework V2 started successfully!")
 
@@ -41,6 +66,7 @@ async def lifespan(app: FastAPI):
 
     # Cleanup
     logger.info("Shutting down MAI Framework V2...")
+    await mlx_client.aclose()
     logger.info("Shutdown complete.")
 
 
@@ -53,7 +79,8 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
         docs_url="/api/docs",
         redoc_url="/api/redoc",
-        openapi_url="/api/openapi.json"
+        openapi_url="/api/openapi.json",
+        default_response_class=ORJSONResponse
     )
 
     # CORS middleware
@@ -65,7 +92,10 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Include routers
+    # Include routers (imported here so `import src.main` stays cheap for
+    # --reload cycles and test collection)
+    from src.api.routes import health, chat
+
     app.include_router(health.router)
     app.include_router(chat.router)
 
@@ -81,5 +111,7 @@ if __name__ == "__main__":
         "src.main:app",
         host=settings.api_host,
         port=settings.api_port,
-        reload=settings.debug
+        reload=settings.debug,
+        loop="uvloop",
+        http="httptools"
     )
@@ -129,9 +129,10 @@ setup_mlx_venv() {
     pip install --quiet --upgrade \
         mlx-lm==0.28.4 \
         fastapi \
-        uvicorn \
+        'uvicorn[standard]' \
         httpx \
-        pydantic-settings
+        pydantic-settings \
+        orjson
 
     print_success "MLX virtual environment ready."
 }
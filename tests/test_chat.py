@@ -1,7 +1,9 @@
 """Tests for chat endpoints."""
 
+import json
+
 import pytest
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, Mock
 
 
 def test_chat_completions_validation_empty_messages(client):
@@ -61,8 +63,7 @@ def test_chat_completions_validation_max_tokens_zero(client):
 @patch('src.api.routes.chat.get_mlx_client')
 def test_chat_completions_success(mock_get_client, client, sample_chat_request):
     """Test successful chat completion with mocked MLX client."""
-    mock_client = AsyncMock()
-    mock_client.chat_completion.return_value = {
+    upstream_body = json.dumps({
         "id": "test-123",
         "object": "chat.completion",
         "created": 1234567890,
@@ -72,7 +73,12 @@ def test_chat_completions_success(mock_get_client, client, sample_chat_request):
             "message": {"role": "assistant", "content": "Hello!"},
             "finish_reason": "stop"
         }]
-    }
+    }).encode()
+    mock_client = AsyncMock()
+    mock_client.chat_completion_raw.return_value = Mock(
+        content=upstream_body,
+        status_code=200
+    )
     mock_get_client.return_value = mock_client
 
     response = client.post(
@@ -89,7 +95,7 @@ def test_chat_completions_success(mock_get_client, client, sample_chat_request):
 def test_chat_completions_mlx_error(mock_get_client, client, sample_chat_request):
     """Test chat completion handles MLX client errors."""
     mock_client = AsyncMock()
-    mock_client.chat_completion.side_effect = Exception("MLX server unavailable")
+    mock_client.chat_completion_raw.side_effect = Exception("MLX server unavailable")
     mock_get_client.return_value = mock_client
 
     response = client.post(